@@ -2,6 +2,7 @@ import argparse
 import concurrent.futures
 import logging
 import os
+import re
 
 from core import utils, venue
 from tqdm import tqdm
@@ -77,7 +78,7 @@ def main():
         proxies['https'] = args.https_proxy
 
     # parse venue
-    venue_name = args.venue.lower()
+    venue_name = venue.canonical_name(args.venue)
     venue_publisher = venue.parse_venue(venue_name)
 
     if not venue_publisher:
@@ -96,11 +97,19 @@ def main():
             utils.print_warning(
                 f'The journal "{venue_name}" does not require the year field, but it is currently set to "{args.year}".')
 
+    # compile keyword
+    keyword = None
+    if args.keyword:
+        try:
+            keyword = re.compile(args.keyword, re.IGNORECASE)
+        except re.error as e:
+            utils.print_and_exit(f'Invalid keyword regex: {e}')
+
     # instantiate venue
     logging.info(args)
     publisher = venue_publisher(save_dir=args.save_dir,
                                 sleep_time_per_paper=args.sleep_time_per_paper,
-                                keyword=args.keyword,
+                                keyword=keyword,
                                 venue_name=venue_name,
                                 year=args.year,
                                 volume=args.volume,
@@ -111,12 +120,18 @@ def main():
     else:
         if args.parallel:
             with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=min(os.cpu_count(), publisher.max_thread_count)) as executor:
+                    max_workers=publisher.max_thread_count) as executor:
                 futures = [executor.submit(publisher.process_one, paper_entry) for paper_entry in paper_list]
-                with tqdm(total=len(paper_list)) as progress_bar:
-                    for future in concurrent.futures.as_completed(futures):
-                        if future.done():
-                            progress_bar.update(1)
+                try:
+                    with tqdm(total=len(paper_list)) as progress_bar:
+                        for future in concurrent.futures.as_completed(futures):
+                            if future.done():
+                                progress_bar.update(1)
+                except KeyboardInterrupt:
+                    # 取消尚未开始的任务，并让正在处理的论文尽快结束，否则退出时会等待所有任务完成
+                    publisher.cancel()
+                    executor.shutdown(cancel_futures=True)
+                    utils.print_and_exit('Interrupted!')
         else:
             for paper_entry in tqdm(paper_list):
                 publisher.process_one(paper_entry)
@@ -1,9 +1,10 @@
+import importlib
 import logging
+import os
 import random
+import threading
 from typing import Dict
 
-import requests
-
 _user_agent = [
     # desktop
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/75.0.3770.142 Safari/537.36',
@@ -15,6 +16,43 @@ _user_agent = [
     'Mozilla/5.0 (iPhone; CPU iPhone OS 18_0_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.0.1 Mobile/22A3370 Safari/604.1'
 ]
 
+# (连接超时, 读取超时)，单位为秒。避免某个连接卡住后永久占用下载线程
+_timeout = (10, 60)
+
+# 流式下载时每次读取的字节数
+_chunk_size = 1 << 16
+
+# 每个下载线程持有一个 Session，复用 TCP/TLS 连接，避免每篇论文都重新握手
+_local = threading.local()
+
+
+def _get_session():
+    session = getattr(_local, 'session', None)
+    if session is None:
+        # requests 导入较慢，推迟到第一次发起请求时再导入，缩短 GUI 的启动时间
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = _local.session = requests.Session()
+        # 对连接错误以及限流/服务端错误做有限次数的退避重试；重试耗尽后仍返回响应，交给 raise_for_status 处理。
+        # 不遵循 Retry-After：urllib3 会按该值不设上限地 sleep，且无法被取消，停止下载时线程会长时间卡住
+        adapter = HTTPAdapter(max_retries=Retry(total=3,
+                                                backoff_factor=0.5,
+                                                status_forcelist=(429, 500, 502, 503, 504),
+                                                respect_retry_after_header=False,
+                                                raise_on_status=False))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
+
+
+def warm_up() -> None:
+    """
+    预先导入 requests，可在后台线程中调用
+    """
+    importlib.import_module('requests')
+
 
 def _get_headers() -> Dict[str, str]:
     return {
@@ -25,9 +63,9 @@ def _get_headers() -> Dict[str, str]:
 def download_html(url: str, proxies: Dict[str, str] = None) -> str | None:
     try:
         if not proxies:
-            r = requests.get(url=url, headers=_get_headers())
+            r = _get_session().get(url=url, headers=_get_headers(), timeout=_timeout)
         else:
-            r = requests.get(url=url, headers=_get_headers(), proxies=proxies)
+            r = _get_session().get(url=url, headers=_get_headers(), proxies=proxies, timeout=_timeout)
         r.raise_for_status()
         r.encoding = r.apparent_encoding
         return r.text
@@ -36,19 +74,29 @@ def download_html(url: str, proxies: Dict[str, str] = None) -> str | None:
 
 
 def download_file(url: str, filename: str, proxies: Dict[str, str] = None) -> None:
+    # 边下载边写入临时文件，内存占用与文件大小无关；下载完整后再重命名，
+    # 避免中途失败留下不完整的文件，导致之后因文件已存在而被跳过
+    part_filename = filename + '.part'
     try:
         if not proxies:
-            r = requests.get(url, headers=_get_headers())
+            r = _get_session().get(url, headers=_get_headers(), timeout=_timeout, stream=True)
         else:
-            r = requests.get(url, headers=_get_headers(), proxies=proxies)
-        r.raise_for_status()
-
-        with open(filename, 'wb') as file:
-            file.write(r.content)
+            r = _get_session().get(url, headers=_get_headers(), proxies=proxies, timeout=_timeout, stream=True)
+        with r:
+            r.raise_for_status()
+            with open(part_filename, 'wb') as file:
+                for chunk in r.iter_content(chunk_size=_chunk_size):
+                    file.write(chunk)
+        os.replace(part_filename, filename)
     except Exception as e:
         logging.error(f'download file: url = {url}, filename = {filename}, error: {e}')
+        if os.path.exists(part_filename):
+            os.remove(part_filename)
 
 
-def get_real_url(url: str) -> str:
-    r = requests.head(url, headers=_get_headers(), allow_redirects=True)
-    return r.url
+def get_real_url(url: str) -> str | None:
+    try:
+        r = _get_session().head(url, headers=_get_headers(), allow_redirects=True, timeout=_timeout)
+        return r.url
+    except Exception as e:
+        logging.error(f'get real url: {url}, error: {e}')
@@ -1,3 +1,4 @@
+import threading
 from typing import List
 
 from bs4 import BeautifulSoup, element
@@ -9,6 +10,25 @@ def get_parser(html: str, parser: str = 'lxml') -> BeautifulSoup:
     return BeautifulSoup(html, parser)
 
 
+# 每个线程缓存最近一次由 parse_href 解析的页面。同一篇论文的页面通常要依次查找
+# PDF 链接、备用链接和 slides 链接，缓存后只需解析一次。
+# 线程池中的线程会长期存活，处理完页面后应调用 release_cache 释放解析树
+_local = threading.local()
+
+
+def _get_cached_parser(html: str) -> BeautifulSoup:
+    cached = getattr(_local, 'cached', None)
+    if cached is not None and cached[0] is html:
+        return cached[1]
+    parser = get_parser(html)
+    _local.cached = (html, parser)
+    return parser
+
+
+def release_cache() -> None:
+    _local.cached = None
+
+
 def get_href(tag: Tag) -> str | None:
     if not tag or tag.name != 'a' or 'href' not in tag.attrs:
         return None
@@ -22,7 +42,7 @@ def get_href_first(tags: List[Tag]) -> str | None:
 
 
 def parse_href(html: str, a_selector: str) -> str | None:
-    parser = get_parser(html)
+    parser = _get_cached_parser(html)
     return get_href_first(parser.select(a_selector))
 
 
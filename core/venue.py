@@ -3,11 +3,10 @@ import os
 import random
 import re
 import threading
-import time
 from abc import ABC, ABCMeta, abstractmethod
 from collections import OrderedDict
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, List, Pattern, Tuple, Union
 
 from . import downloader, html_parser, utils
 
@@ -28,24 +27,37 @@ class _Base(ABC):
     def __init__(self,
                  save_dir: str,
                  sleep_time_per_paper: float = 2,
-                 keyword: str = None,
+                 keyword: Union[str, Pattern] = None,
                  proxies: Dict[str, str] = None,
+                 cancel_event: threading.Event = None,
                  **kwargs):
         self.save_dir = save_dir
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
         self.sleep_time_per_paper = sleep_time_per_paper
+        # 关键词正则只编译一次；调用方也可以直接传入已编译的 Pattern
+        if isinstance(keyword, str) and keyword:
+            keyword = re.compile(keyword, re.IGNORECASE)
         self.keyword = keyword
         self.proxies = proxies
+        # 置位后，正在处理的论文会尽快结束，不再下载剩余文件，也不再等待 sleep_time_per_paper
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
         self.dblp_url_prefix = random.choice(['https://dblp.org/db', 'https://dblp.uni-trier.de/db'])
         self.url = self._get_url()
 
-    @property
-    def max_thread_count(self) -> int:
+    # 并行下载时的最大线程数，避免对刊物网站造成过大压力。
+    # 定义为类属性，便于在实例化之前（如 GUI 中选择刊物时）读取
+    max_thread_count: int = 8
+
+    def cancel(self) -> None:
         """
-        返回最大线程数
+        请求取消尚未完成的下载
         """
-        return 8
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
 
     def get_paper_list(self) -> List[Tuple[str, str]]:
         if not self.url:
@@ -66,9 +78,12 @@ class _Base(ABC):
         paper_title, paper_url = paper_info
         tid = threading.get_native_id()
 
+        if self.cancelled:
+            return
+
         # 匹配关键词
         if self.keyword:
-            match_result = re.search(self.keyword, paper_title, re.IGNORECASE)
+            match_result = self.keyword.search(paper_title)
             if not match_result:
                 logging.info(f'(tid {tid}) The paper "{paper_title}" does not contain the required keywords!')
                 return
@@ -85,20 +100,24 @@ class _Base(ABC):
             if paper_html is None:
                 return
 
-            paper_file_url = self._get_paper_file_url(paper_html)
-            if paper_file_url is None:
-                return
-            logging.info(f'(tid {tid}) downloading paper: {paper_file_url}')
-            self._download_paper(utils.get_absolute_url(paper_url, paper_file_url), paper_title)
-
-            paper_slides_url = self._get_slides_file_url(paper_html)
-            if paper_slides_url:
-                logging.info(f'(tid {tid}) downloading slides: {paper_slides_url}')
-                self._download_slides(utils.get_absolute_url(paper_url, paper_slides_url), paper_title)
-
-        # 如果sleep_time_per_paper不为0，下载完成后暂停一段时间
+            try:
+                paper_file_url = self._get_paper_file_url(paper_html)
+                if paper_file_url is None or self.cancelled:
+                    return
+                logging.info(f'(tid {tid}) downloading paper: {paper_file_url}')
+                self._download_paper(utils.get_absolute_url(paper_url, paper_file_url), paper_title)
+
+                paper_slides_url = self._get_slides_file_url(paper_html)
+                if paper_slides_url and not self.cancelled:
+                    logging.info(f'(tid {tid}) downloading slides: {paper_slides_url}')
+                    self._download_slides(utils.get_absolute_url(paper_url, paper_slides_url), paper_title)
+            finally:
+                # 该页面已处理完毕，释放 parse_href 缓存的解析树
+                html_parser.release_cache()
+
+        # 如果sleep_time_per_paper不为0，下载完成后暂停一段时间；取消时立即返回
         if self.sleep_time_per_paper:
-            time.sleep(self.sleep_time_per_paper)
+            self.cancel_event.wait(self.sleep_time_per_paper)
 
     @staticmethod
     def _paper_url_is_file_url(paper_url: str) -> bool:
@@ -573,6 +592,11 @@ _venue_dict = {
     'jmlr': {'name': 'JMLR(Journal)', 'publisher': JMLR},
 }
 
+# 展示名称 -> 小写名称，同名时保留第一个
+_lower_name_dict = {}
+for _k, _v in _venue_dict.items():
+    _lower_name_dict.setdefault(_v['name'], _k)
+
 
 def get_available_venue_list(lower_case: bool = True) -> List[str]:
     if lower_case:
@@ -590,22 +614,22 @@ def get_lower_name(upper_venue_name: str) -> str | None:
     if not upper_venue_name:
         return None
 
-    for k, v in _venue_dict.items():
-        if v['name'] == upper_venue_name:
-            return k
+    return _lower_name_dict.get(upper_venue_name)
 
-    return None
+
+def canonical_name(venue: str) -> str:
+    """
+    去掉所有空白字符（包括从网页复制时带入的不间断空格）并统一为小写
+    """
+    return ''.join(venue.split()).casefold()
 
 
 def parse_venue(venue: str) -> type | None:
     if not venue:
         return None
 
-    venue = venue.lower()
-    if venue not in _venue_dict.keys():
-        return None
-
-    return _venue_dict[venue]['publisher']
+    entry = _venue_dict.get(canonical_name(venue))
+    return entry['publisher'] if entry else None
 
 
 def is_conference(venue_publisher: type):
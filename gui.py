@@ -1,22 +1,31 @@
 # -*- coding: utf-8 -*-
+import collections
+import functools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 import threading
+import time
 from datetime import datetime
 from typing import List
 
-from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, QMutex, QWaitCondition, Qt, QUrl
-from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtCore import (
+    QObject, QRunnable, QThread, QThreadPool, QTimer, QLocale,
+    pyqtSignal, pyqtSlot, Qt, QUrl
+)
+from PyQt5.QtGui import QDesktopServices, QDoubleValidator, QIntValidator
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QFileDialog, QTextEdit,
-    QMessageBox, QGridLayout, QGroupBox, QRadioButton,
+    QLabel, QLineEdit, QPushButton, QFileDialog, QPlainTextEdit,
+    QMessageBox, QGridLayout, QFormLayout, QGroupBox, QRadioButton,
     QButtonGroup, QMainWindow, QMenu, QAction, QComboBox,
-    QProgressBar, QDialog
+    QProgressBar, QDialog, QSpinBox
 )
-from core import utils, venue
+from core import downloader, utils, venue
 
 ##################################################################
 #                            Constant                            #
@@ -25,6 +34,21 @@ LANGUAGE_FILE = utils.get_abs_path('config', os.path.join('i18n', 'lang.json'))
 CONFIG_FILE = utils.get_abs_path('config', 'config.json')
 QSS_FILE = utils.get_abs_path('config', 'gui.qss')
 DEFAULT_SLEEP_TIME = 2
+# 日志窗口最多保留的行数，以及可导出的日志历史的最大行数
+LOG_MAX_BLOCK_COUNT = 5000
+LOG_HISTORY_MAX_LINES = 200_000
+# 工作线程与日志监听线程之间的队列长度上限
+LOG_QUEUE_MAX_SIZE = 10_000
+
+# 刊物列表及查找表在进程内固定不变，导入时计算一次即可
+_VENUE_ITEMS = tuple(venue.get_available_venue_list(lower_case=False))
+_VENUE_LOWER = {v: venue.get_lower_name(v) for v in _VENUE_ITEMS}
+_VENUE_PUBLISHERS = {v: venue.parse_venue(_VENUE_LOWER[v]) for v in _VENUE_ITEMS}
+# 刊物类型 -> (类型, 必填字段, 忽略字段)：会议必须填写年份，期刊必须填写卷号
+_VENUE_KINDS = {
+    v: ('conference', 'year', 'volume') if venue.is_conference(p) else ('journal', 'volume', 'year')
+    for v, p in _VENUE_PUBLISHERS.items()
+}
 
 PROJECT_START_YEAR = 2024
 PROJECT_VERSION = 'v1.0'
@@ -34,18 +58,127 @@ PROJECT_AUTHORS = [
     '<a href="https://github.com/zh-he">Zhihai He</a>'
 ]
 
+# 已解析的 JSON 文件缓存: path -> (st_mtime_ns, st_size, data)
+_FILE_CACHE = {}
+
+
+def _load_cached(path: str, decode):
+    """
+    读取文件并用 decode 解码；若文件的修改时间和大小均未变化，则直接返回缓存结果
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _FILE_CACHE.get((path, decode))
+    if hit and hit[:2] == key:
+        return hit[2]
+
+    with open(path, 'rb') as file:
+        data = decode(file.read())
+    _FILE_CACHE[(path, decode)] = (*key, data)
+    return data
+
+
+def _decode_utf8(raw: bytes) -> str:
+    return raw.decode('utf-8')
+
+
+def _load_json_cached(path: str):
+    return _load_cached(path, json.loads)
+
+
+def _load_text_cached(path: str) -> str:
+    return _load_cached(path, _decode_utf8)
+
 
 ##################################################################
 #                        Logging Handler                         #
 ##################################################################
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    同一秒内的日志记录复用已格式化的时间字符串，只拼接毫秒部分
+    """
+
+    def __init__(self, fmt=None):
+        super().__init__(fmt)
+        # (秒, 格式化结果) 作为一个整体替换，多线程下也不会读到不一致的组合
+        self._cache = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, cached_time = self._cache
+        if sec != cached_sec:
+            cached_time = time.strftime(self.default_time_format, self.converter(sec))
+            self._cache = (sec, cached_time)
+        return self.default_msec_format % (cached_time, record.msecs)
+
+
+# 所有 GUI 实例共用同一个日志格式化器
+_LOG_FORMATTER = _CachedTimeFormatter('%(asctime)s [%(levelname)s] %(message)s')
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    队列已满时直接丢弃日志并计数，保证下载线程不会因为日志而阻塞
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Handler.handle() 已持有 self.lock
+            self._dropped += 1
+
+    def take_dropped(self) -> int:
+        """返回并清零自上次调用以来丢弃的日志条数"""
+        with self.lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+
+class _BlockingQueueListener(logging.handlers.QueueListener):
+    """
+    停止时阻塞放入结束标记，避免队列已满时 put_nowait 抛出 queue.Full
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
 class QtLogHandler(logging.Handler):
-    def __init__(self, signal):
+    """
+    将日志写入有界缓冲区；只有缓冲区由空变为非空时才发送一次信号，GUI 收到后一次性取走全部日志
+    """
+
+    def __init__(self, signal, capacity: int = 10000):
         super().__init__()
         self.signal = signal
+        # GUI 长时间无响应时只保留最近的 capacity 条，内存和事件队列都有上界
+        self._buf = collections.deque(maxlen=capacity)
+        self._dirty = False
 
     def emit(self, record):
-        msg = self.format(record)
-        self.signal.emit(msg)
+        # 该处理器只由 QueueListener 的线程调用；在 GUI 线程中格式化并发送日志属于回归
+        if __debug__:
+            assert QThread.currentThread() is not QApplication.instance().thread(), \
+                'QtLogHandler.emit must not run on the GUI thread'
+        # Handler.handle() 已持有 self.lock，这里无需再加锁
+        self._buf.append(self.format(record))
+        if not self._dirty:
+            self._dirty = True
+            self.signal.emit()
+
+    def drain(self) -> collections.deque:
+        """取走缓冲区中的全部日志，由 GUI 线程调用"""
+        with self.lock:
+            batch, self._buf = self._buf, collections.deque(maxlen=self._buf.maxlen)
+            self._dirty = False
+        return batch
 
 
 ##################################################################
@@ -55,136 +188,165 @@ class PaperListFetchThread(QThread):
     """
     专门用于获取 paper_list 的线程，防止在主线程里直接调用导致卡顿
     """
-    paper_list_ready = pyqtSignal(list)
+    paper_list_ready = pyqtSignal(object, list)
     error_signal = pyqtSignal(str)
 
-    def __init__(self, publisher_instance):
-        super().__init__()
-        self.publisher_instance = publisher_instance
+    def __init__(self, publisher_factory, parent=None):
+        super().__init__(parent)
+        # publisher 的构造会创建保存目录（磁盘 I/O，可能失败），放到线程里执行
+        self.publisher_factory = publisher_factory
 
     def run(self):
         try:
-            paper_list = self.publisher_instance.get_paper_list()
-            self.paper_list_ready.emit(paper_list)
+            publisher_instance = self.publisher_factory()
+            paper_list = publisher_instance.get_paper_list()
+            self.paper_list_ready.emit(publisher_instance, paper_list)
         except Exception as e:
             logging.exception("Exception occurred while fetching paper list.")
             self.error_signal.emit(str(e))
 
 
-class DownloaderThread(QThread):
+class DownloaderSignals(QObject):
+    """
+    QRunnable 不是 QObject，不能定义信号，由该对象代为承载
+    """
     progress_signal = pyqtSignal()
     finished_signal = pyqtSignal()
     resumed_signal = pyqtSignal()
     paused_signal = pyqtSignal()
 
-    def __init__(self, publisher: type, paper_entry_list: List):
+
+class DownloaderRunnable(QRunnable):
+    """
+    下载任务，提交到 GUI 持有的 QThreadPool 中执行，多次运行之间复用线程
+    """
+
+    def __init__(self, publisher: type, paper_entry_list: List, start: int, end: int):
         super().__init__()
+        # 由 Python 端持有引用，避免线程池在 run() 结束后释放该对象
+        self.setAutoDelete(False)
+        self.signals = DownloaderSignals()
         self.publisher = publisher
+        # 只保存共享列表的引用和区间，避免为每个线程复制子列表
         self.paper_entry_list = paper_entry_list
+        self.start_idx = start
+        self.end_idx = end
 
-        self.paused = False
-        self.stopped = False
         self.thread_id = None
+        self.finished = False
+
+        # 用两个 Event 实现暂停/恢复/停止：
+        # _pause_evt 置位表示「运行中」，清除表示「暂停」；_stop_evt 置位表示「停止」。
+        # 未暂停时的检查只是一次无锁的标志读取
+        self._pause_evt = threading.Event()
+        self._pause_evt.set()
+        self._stop_evt = threading.Event()
 
-        # 互斥锁 + 条件变量，用于暂停/恢复
-        self.mutex = QMutex()
-        self.condition = QWaitCondition()
+    @property
+    def paused(self) -> bool:
+        return not self._pause_evt.is_set()
 
     def pause(self):
-        """请求暂停线程"""
-        if self.isFinished():
+        """请求暂停线程；已暂停或已结束时忽略"""
+        if self.finished or self.paused:
             return
-        self.mutex.lock()
-        self.paused = True
+        self._pause_evt.clear()
         logging.info(f'Thread {self.thread_id} is pausing...')
-        self.mutex.unlock()
 
     def resume(self):
-        """请求恢复线程"""
-        if self.isFinished():
+        """请求恢复线程；未暂停或已结束时忽略"""
+        if self.finished or not self.paused:
             return
-        self.mutex.lock()
-        self.paused = False
         # 唤醒处于 wait() 的线程
-        self.condition.wakeAll()
+        self._pause_evt.set()
         logging.info(f'Thread {self.thread_id} is resuming...')
-        self.mutex.unlock()
 
     def stop(self):
         """请求停止线程"""
-        if self.isFinished():
+        if self.finished:
             return
-        self.mutex.lock()
-        self.stopped = True
+        self._stop_evt.set()
         # 如果当前处于暂停，也要唤醒，才能让 run() 里的 wait() 及时退出
-        if self.paused:
-            self.paused = False
-            self.condition.wakeAll()
+        self._pause_evt.set()
+        # 同时取消 publisher 中正在进行的论文处理（包括每篇论文之后的等待）
+        self.publisher.cancel()
         logging.info(f'Thread {self.thread_id} is stopping...')
-        self.mutex.unlock()
 
     def run(self):
         self.thread_id = threading.get_native_id()
 
-        for paper_entry in self.paper_entry_list:
-            self.mutex.lock()
+        for i in range(self.start_idx, self.end_idx):
+            paper_entry = self.paper_entry_list[i]
             # 如果线程被请求停止，则立刻退出
-            if self.stopped:
-                self.mutex.unlock()
+            if self._stop_evt.is_set():
                 break
 
             # 若处于暂停状态，则在这里等待
             if self.paused:
                 logging.info(f'Thread {self.thread_id} has been paused.')
-                self.paused_signal.emit()
+                self.signals.paused_signal.emit()
 
-                # 调用条件变量的 wait，会释放 mutex 并阻塞当前线程
-                self.condition.wait(self.mutex)
+                self._pause_evt.wait()
 
                 # 被唤醒后，若没有 stopped，则说明是 resume()
-                if not self.stopped:
+                if not self._stop_evt.is_set():
                     logging.info(f'Thread {self.thread_id} has been resumed.')
-                    self.resumed_signal.emit()
+                    self.signals.resumed_signal.emit()
 
             # 再次检查是否 stop，以防在暂停期间被 stop
-            if self.stopped:
-                self.mutex.unlock()
+            if self._stop_evt.is_set():
                 break
-            self.mutex.unlock()
 
-            # 真正去执行任务
-            self.publisher.process_one(paper_entry)
-            self.progress_signal.emit()
+            # 真正去执行任务；单篇论文出错只记录日志，不能让整个任务提前退出而不发送 finished_signal
+            try:
+                self.publisher.process_one(paper_entry)
+            except Exception:
+                logging.exception(f'Thread {self.thread_id} failed to process paper: {paper_entry[0]}')
+            self.signals.progress_signal.emit()
 
+        self.finished = True
         logging.info(f'Thread {self.thread_id} Finished.')
-        self.finished_signal.emit()
+        self.signals.finished_signal.emit()
 
 
 ##################################################################
 #                              GUI                               #
 ##################################################################
 class PaperDownloaderGUI(QMainWindow):
-    log_signal = pyqtSignal(str)
+    # 通知 GUI 有新的日志待取走
+    log_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
 
-        self.threads = []
+        self.workers = []
+        # 持久的线程池，多次运行之间复用线程，避免反复创建/销毁线程
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setExpiryTimeout(-1)
         self.finished_threads = 0
         self.num_threads = 0
         self.task_complete_count = 0
         self.num_tasks = 0
-        self.mutex = QMutex()
+        # 工作线程的信号均以 QueuedConnection 投递到主线程，
+        # 以下计数只在主线程中读写，无需加锁
         self.paused_count = 0
         self.resumed_count = 0
 
         # 新增一个用于获取 paper_list 的线程引用
         self.list_fetch_thread = None
+        self._about_dialog = None
         self.publisher_instance = None
 
+        # 完整的日志历史，日志窗口只保留最近的部分，导出时从这里读取
+        self._log_history = collections.deque(maxlen=LOG_HISTORY_MAX_LINES)
+
+        # 记录各控件当前显示的文本，切换语言时跳过未变化的控件
+        self._current_texts = {}
+
         self.init_language()
-        self.init_ui()
+        # 先设置应用级样式表，控件创建时即按样式表完成首次 polish，避免事后整体重绘
         self.init_style()
+        self.init_ui()
         self.init_logging()
 
     def show_error_message(self, message, need_to_exit=False):
@@ -192,37 +354,67 @@ class PaperDownloaderGUI(QMainWindow):
         if need_to_exit:
             sys.exit()
 
+    def show_input_error(self, message):
+        """在状态栏中显示可恢复的输入错误，3 秒后自动消失"""
+        self.statusBar().showMessage(message, 3000)
+
     def init_language(self):
-        if os.path.exists(LANGUAGE_FILE):
-            with open(LANGUAGE_FILE, 'r', encoding='utf-8') as file:
-                self.languages = json.load(file)
-        else:
+        # _load_json_cached 内部的 os.stat 同时完成了存在性检查
+        try:
+            self.languages = _load_json_cached(LANGUAGE_FILE)
+        except FileNotFoundError:
             self.show_error_message(f'Cannot find {LANGUAGE_FILE}.', need_to_exit=True)
 
         # Initialize default language
         self.current_language = 'en'
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as file:
-                config_dict = json.load(file)
-                if config_dict and 'default_language' in config_dict:
-                    self.current_language = config_dict['default_language']
+        self._config = {}
+        try:
+            config_dict = _load_json_cached(CONFIG_FILE)
+        except FileNotFoundError:
+            config_dict = None
+        if config_dict:
+            # 复制一份，避免修改缓存中的对象
+            self._config = dict(config_dict)
+            if 'default_language' in config_dict:
+                self.current_language = config_dict['default_language']
+
+        # 配置写回做防抖处理：短时间内多次切换语言只写一次文件，退出前再补写一次
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(500)
+        self._persist_timer.timeout.connect(self._persist_config)
+        QApplication.instance().aboutToQuit.connect(self._flush_config)
+
+    @pyqtSlot()
+    def _persist_config(self):
+        with open(CONFIG_FILE, 'w', encoding='utf-8') as file:
+            json.dump(self._config, file, separators=(',', ':'), ensure_ascii=False)
+
+    @pyqtSlot()
+    def _flush_config(self):
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
+            self._persist_config()
 
     def init_ui(self):
-        self.setWindowTitle(self.languages[self.current_language]['project_abbreviation'])
+        T = self.languages[self.current_language]
+        self._T = T
+
+        self.setWindowTitle(T['project_abbreviation'])
 
         # Menu Bar
         menubar = self.menuBar()
         # Language Menu
-        self.language_menu = QMenu(self.languages[self.current_language]['language'], self)
-        self.language_action = QAction(self.languages[self.current_language]['language_switch'], self)
+        self.language_menu = QMenu(T['language'], self)
+        self.language_action = QAction(T['language_switch'], self)
         self.language_action.triggered.connect(self.update_language)
         self.language_menu.addAction(self.language_action)
         menubar.addMenu(self.language_menu)
         # Help Menu
-        self.help_menu = QMenu(self.languages[self.current_language]['help'])
-        self.help_action = QAction(self.languages[self.current_language]['help'])
+        self.help_menu = QMenu(T['help'])
+        self.help_action = QAction(T['help'])
         self.help_action.triggered.connect(self.open_project_link)
-        self.about_action = QAction(self.languages[self.current_language]['about'])
+        self.about_action = QAction(T['about'])
         self.about_action.triggered.connect(self.show_about)
         self.help_menu.addAction(self.help_action)
         self.help_menu.addAction(self.about_action)
@@ -234,99 +426,88 @@ class PaperDownloaderGUI(QMainWindow):
         self.main_layout = QVBoxLayout()
 
         # Group 1: Basic Settings
-        self.basic_settings = QGroupBox(self.languages[self.current_language]['basic_settings'])
-        basic_layout = QGridLayout()
+        self.basic_settings = QGroupBox(T['basic_settings'])
+        basic_layout = QFormLayout()
 
-        self.venue_label = QLabel(self.languages[self.current_language]['venue_label'])
-        basic_layout.addWidget(self.venue_label, 0, 0)
+        self.venue_label = QLabel(T['venue_label'])
         self.venue_input = QComboBox()
-        self.venue_input.addItems(venue.get_available_venue_list(lower_case=False))
-        basic_layout.addWidget(self.venue_input, 0, 1)
+        self.venue_input.addItems(_VENUE_ITEMS)
+        basic_layout.addRow(self.venue_label, self.venue_input)
 
-        self.save_dir_label = QLabel(self.languages[self.current_language]['save_dir_label'])
-        basic_layout.addWidget(self.save_dir_label, 1, 0)
+        self.save_dir_label = QLabel(T['save_dir_label'])
         self.save_dir_input = QLineEdit()
-        basic_layout.addWidget(self.save_dir_input, 1, 1)
-
-        self.browse_button = QPushButton(self.languages[self.current_language]['browse_btn'])
+        self.browse_button = QPushButton(T['browse_btn'])
         self.browse_button.clicked.connect(self.select_save_dir)
-        basic_layout.addWidget(self.browse_button, 1, 2)
+        save_dir_layout = QHBoxLayout()
+        save_dir_layout.addWidget(self.save_dir_input)
+        save_dir_layout.addWidget(self.browse_button)
+        basic_layout.addRow(self.save_dir_label, save_dir_layout)
 
-        self.sleep_time_label = QLabel(self.languages[self.current_language]['sleep_time_label'])
-        basic_layout.addWidget(self.sleep_time_label, 2, 0)
+        self.sleep_time_label = QLabel(T['sleep_time_label'])
         self.sleep_time_input = QLineEdit(str(DEFAULT_SLEEP_TIME))
-        basic_layout.addWidget(self.sleep_time_input, 2, 1)
-
-        self.keyword_label = QLabel(self.languages[self.current_language]['keyword'])
-        basic_layout.addWidget(self.keyword_label, 3, 0)
+        sleep_time_validator = QDoubleValidator(0.0, 3600.0, 3, self)
+        sleep_time_validator.setNotation(QDoubleValidator.StandardNotation)
+        # 数值输入统一使用 C locale 并拒绝千位分隔符，保证通过校验的文本都能直接交给 int()/float()
+        c_locale = QLocale.c()
+        c_locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        sleep_time_validator.setLocale(c_locale)
+        self.sleep_time_input.setValidator(sleep_time_validator)
+        basic_layout.addRow(self.sleep_time_label, self.sleep_time_input)
+
+        self.keyword_label = QLabel(T['keyword'])
         self.keyword_input = QLineEdit()
-        self.keyword_input.setPlaceholderText(self.languages[self.current_language]['keyword_placeholder'])
-        basic_layout.addWidget(self.keyword_input, 3, 1)
+        self.keyword_input.setPlaceholderText(T['keyword_placeholder'])
+        basic_layout.addRow(self.keyword_label, self.keyword_input)
 
         self.basic_settings.setLayout(basic_layout)
         self.main_layout.addWidget(self.basic_settings)
 
         # Group 2: Additional Parameters
-        self.additional_params = QGroupBox(self.languages[self.current_language]['additional_params'])
-        params_layout = QGridLayout()
+        self.additional_params = QGroupBox(T['additional_params'])
+        params_layout = QFormLayout()
 
-        self.year_label = QLabel(self.languages[self.current_language]['year_label'])
-        params_layout.addWidget(self.year_label, 0, 0)
+        self.year_label = QLabel(T['year_label'])
         self.year_input = QLineEdit()
-        params_layout.addWidget(self.year_input, 0, 1)
+        year_validator = QIntValidator(1900, 2100, self)
+        year_validator.setLocale(c_locale)
+        self.year_input.setValidator(year_validator)
+        params_layout.addRow(self.year_label, self.year_input)
 
-        self.volume_label = QLabel(self.languages[self.current_language]['volume_label'])
-        params_layout.addWidget(self.volume_label, 1, 0)
+        self.volume_label = QLabel(T['volume_label'])
         self.volume_input = QLineEdit()
-        params_layout.addWidget(self.volume_input, 1, 1)
+        volume_validator = QIntValidator(1, 10000, self)
+        volume_validator.setLocale(c_locale)
+        self.volume_input.setValidator(volume_validator)
+        params_layout.addRow(self.volume_label, self.volume_input)
 
         self.additional_params.setLayout(params_layout)
         self.main_layout.addWidget(self.additional_params)
 
-        # Group 3: Advanced Settings
-        self.advanced_settings = QGroupBox(self.languages[self.current_language]['advanced_settings'])
-        self.http_proxy_label = QLabel(self.languages[self.current_language]['http_proxy_label'])
-        self.http_proxy_input = QLineEdit()
-
-        self.https_proxy_label = QLabel(self.languages[self.current_language]['https_proxy_label'])
-        self.https_proxy_input = QLineEdit()
+        # 数值输入不合法时禁用「Run」按钮；只检查间隔时间和当前刊物必填的年份/卷号，
+        # 被忽略的那一项不影响按钮状态
+        self._year_volume_inputs = {'year': self.year_input, 'volume': self.volume_input}
+        for numeric_input in (self.sleep_time_input, self.year_input, self.volume_input):
+            numeric_input.textChanged.connect(self.on_input_changed)
+        self.venue_input.currentTextChanged.connect(self.on_input_changed)
+        self.venue_input.currentTextChanged.connect(self._update_thread_count_limit)
 
-        self.parallel_label = QLabel(self.languages[self.current_language]['parallel'])
-        self.parallel_enable_button = QRadioButton(self.languages[self.current_language]['enable'])
-        self.parallel_disable_button = QRadioButton(self.languages[self.current_language]['disable'])
-        self.parallel_disable_button.setChecked(True)
-        self.btn_group = QButtonGroup()
-        self.btn_group.addButton(self.parallel_enable_button)
-        self.btn_group.addButton(self.parallel_disable_button)
-        self.btn_group.setExclusive(True)
-
-        combined_label_layout = QVBoxLayout()
-        combined_label_layout.addWidget(self.http_proxy_label)
-        combined_label_layout.addWidget(self.https_proxy_label)
-        combined_label_layout.addWidget(self.parallel_label)
-
-        combined_input_layout = QVBoxLayout()
-        combined_input_layout.addWidget(self.http_proxy_input)
-        combined_input_layout.addWidget(self.https_proxy_input)
-        parallel_btn_group = QHBoxLayout()
-        parallel_btn_group.addWidget(self.parallel_enable_button)
-        parallel_btn_group.addWidget(self.parallel_disable_button)
-        combined_input_layout.addLayout(parallel_btn_group)
-
-        combined_layout = QHBoxLayout()
-        combined_layout.addLayout(combined_label_layout)
-        combined_layout.addLayout(combined_input_layout)
-        self.advanced_settings.setLayout(combined_layout)
+        # Group 3: Advanced Settings
+        # 高级设置默认折叠，首次勾选时才创建其中的控件
+        self.advanced_settings = QGroupBox(T['advanced_settings'])
+        self.advanced_settings.setCheckable(True)
+        self.advanced_settings.setChecked(False)
+        self.advanced_settings.toggled.connect(self._ensure_advanced)
+        self._advanced_built = False
         self.main_layout.addWidget(self.advanced_settings)
 
         execution_layout = QHBoxLayout()
-        self.run_button = QPushButton(self.languages[self.current_language]['run'])
+        self.run_button = QPushButton(T['run'])
         self.run_button.clicked.connect(self.run_downloader)
-        self.stop_button = QPushButton(self.languages[self.current_language]['stop'])
+        self.stop_button = QPushButton(T['stop'])
         self.stop_button.clicked.connect(self.stop_downloader)
-        self.pause_button = QPushButton(self.languages[self.current_language]['pause'])
+        self.pause_button = QPushButton(T['pause'])
         self.pause_button.clicked.connect(self.pause_downloader)
-        self.resume_button = QPushButton(self.languages[self.current_language]['resume'])
+        self.resume_button = QPushButton(T['resume'])
         self.resume_button.clicked.connect(self.resume_downloader)
 
         execution_layout.addWidget(self.run_button)
@@ -341,6 +522,9 @@ class PaperDownloaderGUI(QMainWindow):
         self.pause_button.setEnabled(False)
         self.resume_button.setEnabled(False)
 
+        # 输入错误通过状态栏提示
+        self.statusBar().setStyleSheet('color: red')
+
         self.progress_bar = QProgressBar(self)
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setAlignment(Qt.AlignCenter)
@@ -348,65 +532,246 @@ class PaperDownloaderGUI(QMainWindow):
         self.main_layout.addWidget(self.progress_bar)
 
         # Logs Section
-        self.log_group = QGroupBox(self.languages[self.current_language]['log'])
+        # 日志区域在第一条日志到达时才创建，在此之前用占位控件保持布局顺序
+        self.log_group = None
+        self._log_placeholder = QWidget()
+        self.main_layout.addWidget(self._log_placeholder, 1)
+
+        central_widget.setLayout(self.main_layout)
+
+        # 界面文本与 i18n 键的绑定关系，切换语言时统一遍历更新
+        self._i18n_bindings = [
+            (self, self.setWindowTitle, 'project_abbreviation'),
+
+            (self.language_menu, self.language_menu.setTitle, 'language'),
+            (self.language_action, self.language_action.setText, 'language_switch'),
+            (self.help_menu, self.help_menu.setTitle, 'help'),
+            (self.help_action, self.help_action.setText, 'help'),
+            (self.about_action, self.about_action.setText, 'about'),
+
+            (self.basic_settings, self.basic_settings.setTitle, 'basic_settings'),
+            (self.venue_label, self.venue_label.setText, 'venue_label'),
+            (self.save_dir_label, self.save_dir_label.setText, 'save_dir_label'),
+            (self.browse_button, self.browse_button.setText, 'browse_btn'),
+            (self.sleep_time_label, self.sleep_time_label.setText, 'sleep_time_label'),
+            (self.keyword_label, self.keyword_label.setText, 'keyword'),
+            (self.keyword_input, self.keyword_input.setPlaceholderText, 'keyword_placeholder'),
+
+            (self.additional_params, self.additional_params.setTitle, 'additional_params'),
+            (self.year_label, self.year_label.setText, 'year_label'),
+            (self.volume_label, self.volume_label.setText, 'volume_label'),
+
+            (self.advanced_settings, self.advanced_settings.setTitle, 'advanced_settings'),
+
+            (self.run_button, self.run_button.setText, 'run'),
+            (self.stop_button, self.stop_button.setText, 'stop'),
+            (self.pause_button, self.pause_button.setText, 'pause'),
+            (self.resume_button, self.resume_button.setText, 'resume'),
+        ]
+
+    @pyqtSlot(bool)
+    def _ensure_advanced(self, checked=True):
+        """首次展开时创建高级设置中的控件"""
+        if not checked or self._advanced_built:
+            return
+        self._advanced_built = True
+        T = self._T
+
+        self.http_proxy_label = QLabel(T['http_proxy_label'])
+        self.http_proxy_input = QLineEdit()
+
+        self.https_proxy_label = QLabel(T['https_proxy_label'])
+        self.https_proxy_input = QLineEdit()
+        self._proxies = None
+        self.http_proxy_input.textChanged.connect(self._invalidate_proxies)
+        self.https_proxy_input.textChanged.connect(self._invalidate_proxies)
+
+        self.parallel_label = QLabel(T['parallel'])
+        self.parallel_enable_button = QRadioButton(T['enable'])
+        self.parallel_disable_button = QRadioButton(T['disable'])
+        self.parallel_disable_button.setChecked(True)
+        self.btn_group = QButtonGroup()
+        self.btn_group.addButton(self.parallel_enable_button)
+        self.btn_group.addButton(self.parallel_disable_button)
+        self.btn_group.setExclusive(True)
+
+        # 线程数由用户指定，上限为当前刊物的 max_thread_count，默认取上限
+        self.thread_count_label = QLabel(T['thread_count'])
+        self.thread_count_input = QSpinBox()
+        self.thread_count_input.setMinimum(1)
+        self._update_thread_count_limit()
+        self.thread_count_input.setValue(self.thread_count_input.maximum())
+        self.thread_count_input.setEnabled(False)
+        self.parallel_enable_button.toggled.connect(self.thread_count_input.setEnabled)
+
+        parallel_btn_group = QHBoxLayout()
+        parallel_btn_group.addWidget(self.parallel_enable_button)
+        parallel_btn_group.addWidget(self.parallel_disable_button)
+        parallel_btn_group.addStretch(1)
+        parallel_btn_group.addWidget(self.thread_count_label)
+        parallel_btn_group.addWidget(self.thread_count_input)
+
+        advanced_layout = QFormLayout()
+        advanced_layout.addRow(self.http_proxy_label, self.http_proxy_input)
+        advanced_layout.addRow(self.https_proxy_label, self.https_proxy_input)
+        advanced_layout.addRow(self.parallel_label, parallel_btn_group)
+        self.advanced_settings.setLayout(advanced_layout)
+
+        self._i18n_bindings.extend([
+            (self.http_proxy_label, self.http_proxy_label.setText, 'http_proxy_label'),
+            (self.https_proxy_label, self.https_proxy_label.setText, 'https_proxy_label'),
+            (self.parallel_label, self.parallel_label.setText, 'parallel'),
+            (self.parallel_enable_button, self.parallel_enable_button.setText, 'enable'),
+            (self.parallel_disable_button, self.parallel_disable_button.setText, 'disable'),
+            (self.thread_count_label, self.thread_count_label.setText, 'thread_count'),
+        ])
+
+    def _get_proxies(self):
+        """返回代理配置；代理输入框未修改时复用上一次构造的字典"""
+        # 未启用高级设置时，不使用代理
+        if not self.advanced_settings.isChecked():
+            return {}
+        if self._proxies is None:
+            proxies = {}
+            http_proxy = self.http_proxy_input.text().strip()
+            https_proxy = self.https_proxy_input.text().strip()
+            if http_proxy:
+                proxies['http'] = http_proxy
+            if https_proxy:
+                proxies['https'] = https_proxy
+            self._proxies = proxies
+        return self._proxies
+
+    @pyqtSlot()
+    def _invalidate_proxies(self):
+        self._proxies = None
+
+    def _ensure_log(self):
+        """第一条日志到达时创建日志区域，替换掉占位控件"""
+        if self.log_group is not None:
+            return
+        T = self._T
+
+        self.log_group = QGroupBox(T['log'])
         log_layout = QVBoxLayout()
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCK_COUNT)
+        # 日志只追加不编辑，关闭撤销栈，避免每次插入都记录一份撤销数据；不自动换行，省去换行排版
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.setLineWrapMode(QPlainTextEdit.NoWrap)
         log_layout.addWidget(self.log_output)
         log_button_layout = QHBoxLayout()
         log_button_layout.addStretch(1)
-        self.log_export_button = QPushButton(self.languages[self.current_language]['export'])
+        self.log_export_button = QPushButton(T['export'])
         self.log_export_button.clicked.connect(self.export_log)
-        self.log_clear_button = QPushButton(self.languages[self.current_language]['clear'])
+        self.log_clear_button = QPushButton(T['clear'])
         self.log_clear_button.clicked.connect(self.clear_log)
         log_button_layout.addWidget(self.log_export_button)
         log_button_layout.addWidget(self.log_clear_button)
         log_layout.addLayout(log_button_layout)
         self.log_group.setLayout(log_layout)
-        self.main_layout.addWidget(self.log_group)
 
-        central_widget.setLayout(self.main_layout)
+        self.main_layout.replaceWidget(self._log_placeholder, self.log_group)
+        self._log_placeholder.deleteLater()
+        self._log_placeholder = None
+
+        self._i18n_bindings.extend([
+            (self.log_group, self.log_group.setTitle, 'log'),
+            (self.log_export_button, self.log_export_button.setText, 'export'),
+            (self.log_clear_button, self.log_clear_button.setText, 'clear'),
+        ])
 
     def init_style(self):
-        if not os.path.exists(QSS_FILE):
+        try:
+            qss = _load_text_cached(QSS_FILE)
+        except FileNotFoundError:
             self.show_error_message(f'Cannot find stylesheet {QSS_FILE}.', need_to_exit=True)
 
-        with open(QSS_FILE, 'r', encoding='utf-8') as f:
-            qss = f.read()
-        if qss:
-            self.setStyleSheet(qss)
+        # 样式表作用于整个应用，多个窗口共享同一份解析结果
+        app = QApplication.instance()
+        if qss and app.styleSheet() != qss:
+            app.setStyleSheet(qss)
 
     def init_logging(self):
-        self.log_signal.connect(self.append_log)
-        log_handler = QtLogHandler(self.log_signal)
-        log_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
-        log_handler.setLevel(logging.INFO)
+        self.log_signal.connect(self._drain_logs, Qt.QueuedConnection)
+        self.log_handler = QtLogHandler(self.log_signal)
+        self.log_handler.setFormatter(_LOG_FORMATTER)
+        self.log_handler.setLevel(logging.INFO)
+
+        # 工作线程只把日志记录放入队列，由监听线程负责格式化并通知 GUI
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        self._queue_handler = _NonBlockingQueueHandler(self._log_queue)
+        self._log_listener = _BlockingQueueListener(self._log_queue, self.log_handler,
+                                                    respect_handler_level=True)
+        self._log_listener.start()
 
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
+        # 只替换之前的 GUI 实例安装的处理器，保留外部（如嵌入方或测试）配置的处理器
         for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-        logger.addHandler(log_handler)
+            if isinstance(handler, _NonBlockingQueueHandler):
+                logger.removeHandler(handler)
+        logger.addHandler(self._queue_handler)
+
+        # 合并短时间内到达的多批日志，每 30ms 最多插入一次
+        self._log_pending = []
+        self._log_append_timer = QTimer(self)
+        self._log_append_timer.setSingleShot(True)
+        self._log_append_timer.setInterval(30)
+        self._log_append_timer.timeout.connect(self._flush_pending_logs)
+
+        # 退出时把处理器从根 logger 上摘下，避免其继续引用已销毁的信号
+        QApplication.instance().aboutToQuit.connect(self._detach_log_handler)
+
+    @pyqtSlot()
+    def _detach_log_handler(self):
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._log_listener.stop()
+
+    @pyqtSlot()
+    def _drain_logs(self):
+        batch = self.log_handler.drain()
+        dropped = self._queue_handler.take_dropped()
+        if dropped:
+            batch.append(f'[WARNING] {dropped} log records were dropped because the log queue was full.')
+        if batch:
+            self.append_log('\n'.join(batch))
+
+    def closeEvent(self, event):
+        # 关闭窗口时停止所有下载任务，并在有限时间内等待线程退出
+        for worker in self.workers:
+            worker.stop()
+        self.thread_pool.waitForDone(5000)
+        if self.list_fetch_thread is not None:
+            self.list_fetch_thread.wait(5000)
+        super().closeEvent(event)
 
     @staticmethod
     def open_project_link():
         QDesktopServices.openUrl(QUrl(PROJECT_URL))
 
     def show_about(self):
-        about_dialog = QDialog()
-        about_dialog.setWindowTitle(self.languages[self.current_language]['about'])
+        # 对话框只在第一次打开时创建，之后直接复用
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.exec_()
+
+    def _build_about_dialog(self):
+        T = self._T
+        about_dialog = QDialog(self)
         vbox_layout = QVBoxLayout()
 
-        project_name_label = QLabel(self.languages[self.current_language]['project_name'])
+        project_name_label = QLabel(T['project_name'])
         project_name_label.setAlignment(Qt.AlignCenter)
         vbox_layout.addWidget(project_name_label)
 
         grid_layout = QGridLayout()
-        project_abbreviation_label = QLabel(self.languages[self.current_language]['abbreviation'])
-        project_abbreviation_content = QLabel(self.languages[self.current_language]['project_abbreviation'])
-        project_version_label = QLabel(self.languages[self.current_language]['version'])
+        project_abbreviation_label = QLabel(T['abbreviation'])
+        project_abbreviation_content = QLabel(T['project_abbreviation'])
+        project_version_label = QLabel(T['version'])
         project_version_content = QLabel(PROJECT_VERSION)
-        author_label = QLabel(self.languages[self.current_language]["author"])
+        author_label = QLabel(T["author"])
         author_list = QLabel(', '.join(PROJECT_AUTHORS))
         author_list.setOpenExternalLinks(True)
         grid_layout.addWidget(project_abbreviation_label, 0, 0)
@@ -422,82 +787,116 @@ class PaperDownloaderGUI(QMainWindow):
         vbox_layout.addWidget(copyright_label)
 
         about_dialog.setLayout(vbox_layout)
-        about_dialog.exec_()
+
+        # 切换语言时与主窗口一同更新
+        bindings = [
+            (about_dialog, about_dialog.setWindowTitle, 'about'),
+            (project_name_label, project_name_label.setText, 'project_name'),
+            (project_abbreviation_label, project_abbreviation_label.setText, 'abbreviation'),
+            (project_abbreviation_content, project_abbreviation_content.setText, 'project_abbreviation'),
+            (project_version_label, project_version_label.setText, 'version'),
+            (author_label, author_label.setText, 'author'),
+        ]
+        for widget, setter, key in bindings:
+            self._set_text(widget, setter, T[key])
+        self._i18n_bindings.extend(bindings)
+        return about_dialog
 
     def start_progress(self):
-        self.mutex.lock()
         self.progress_bar.setValue(0)
-        self.mutex.unlock()
 
         self.progress_bar.show()
 
-    def update_progress(self):
-        self.mutex.lock()
+    def _set_progress(self, value: int):
+        # 百分比未变化时不刷新进度条，避免无意义的重绘
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+
+    @pyqtSlot()
+    def on_thread_progress(self):
+        """某个线程完成一篇论文时的回调"""
         self.task_complete_count += 1
-        progress_value = int(round(self.task_complete_count / self.num_tasks, 2) * 100)
-        self.progress_bar.setValue(progress_value)
-        self.mutex.unlock()
+        self._set_progress(int(round(self.task_complete_count / self.num_tasks, 2) * 100))
 
     def reset_progress(self):
-        self.threads.clear()
+        # 断开已结束任务的信号连接，并释放承载信号的 QObject
+        for worker in self.workers:
+            signals = worker.signals
+            for signal, slot in ((signals.finished_signal, self.finish_downloader),
+                                 (signals.progress_signal, self.on_thread_progress),
+                                 (signals.paused_signal, self.on_thread_paused),
+                                 (signals.resumed_signal, self.on_thread_resumed)):
+                try:
+                    signal.disconnect(slot)
+                except TypeError:
+                    pass
+            signals.deleteLater()
+        self.workers.clear()
         self.finished_threads = 0
         self.num_tasks = 0
         self.task_complete_count = 0
         self.progress_bar.hide()
 
+    def _set_text(self, widget, setter, text):
+        """仅当文本发生变化时才调用 setter，减少不必要的重绘和布局"""
+        key = id(widget)
+        if self._current_texts.get(key) != text:
+            setter(text)
+            self._current_texts[key] = text
+
     def update_language(self):
-        if self.current_language == 'en':
-            self.current_language = 'cn'
-        else:
-            self.current_language = 'en'
-
-        with open(CONFIG_FILE, 'w+', encoding='utf-8') as file:
-            json.dump({
-                'default_language': self.current_language
-            }, file, ensure_ascii=False, indent=4)
-
-        self.setWindowTitle(self.languages[self.current_language]['project_abbreviation'])
-
-        self.language_menu.setTitle(self.languages[self.current_language]['language'])
-        self.language_action.setText(self.languages[self.current_language]['language_switch'])
-        self.help_menu.setTitle(self.languages[self.current_language]['help'])
-        self.help_action.setText(self.languages[self.current_language]['help'])
-        self.about_action.setText(self.languages[self.current_language]['about'])
-
-        self.basic_settings.setTitle(self.languages[self.current_language]['basic_settings'])
-        self.venue_label.setText(self.languages[self.current_language]['venue_label'])
-        self.save_dir_label.setText(self.languages[self.current_language]['save_dir_label'])
-        self.browse_button.setText(self.languages[self.current_language]['browse_btn'])
-        self.sleep_time_label.setText(self.languages[self.current_language]['sleep_time_label'])
-        self.keyword_label.setText(self.languages[self.current_language]['keyword'])
-        self.keyword_input.setPlaceholderText(self.languages[self.current_language]['keyword_placeholder'])
-
-        self.additional_params.setTitle(self.languages[self.current_language]['additional_params'])
-        self.year_label.setText(self.languages[self.current_language]['year_label'])
-        self.volume_label.setText(self.languages[self.current_language]['volume_label'])
-
-        self.advanced_settings.setTitle(self.languages[self.current_language]['advanced_settings'])
-        self.http_proxy_label.setText(self.languages[self.current_language]['http_proxy_label'])
-        self.https_proxy_label.setText(self.languages[self.current_language]['https_proxy_label'])
-        self.parallel_label.setText(self.languages[self.current_language]['parallel'])
-        self.parallel_enable_button.setText(self.languages[self.current_language]['enable'])
-        self.parallel_disable_button.setText(self.languages[self.current_language]['disable'])
-
-        self.run_button.setText(self.languages[self.current_language]['run'])
-        self.stop_button.setText(self.languages[self.current_language]['stop'])
-        self.pause_button.setText(self.languages[self.current_language]['pause'])
-        self.resume_button.setText(self.languages[self.current_language]['resume'])
-
-        self.log_group.setTitle(self.languages[self.current_language]['log'])
-        self.log_export_button.setText(self.languages[self.current_language]['export'])
-        self.log_clear_button.setText(self.languages[self.current_language]['clear'])
+        # 按 lang.json 中的顺序轮换语言，新增语言无需修改代码
+        languages = tuple(self.languages)
+        idx = languages.index(self.current_language)
+        self.current_language = languages[(idx + 1) % len(languages)]
+
+        self._config['default_language'] = self.current_language
+        self._persist_timer.start()
+
+        T = self.languages[self.current_language]
+        self._T = T
+        # 暂停重绘，所有文本更新完成后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            for widget, setter, key in self._i18n_bindings:
+                self._set_text(widget, setter, T[key])
+        finally:
+            self.setUpdatesEnabled(True)
 
     def select_save_dir(self):
-        directory = QFileDialog.getExistingDirectory(self, self.languages[self.current_language]['select_save_dir'])
+        directory = QFileDialog.getExistingDirectory(self, self._T['select_save_dir'])
         if directory:
             self.save_dir_input.setText(directory)
 
+    @pyqtSlot()
+    def _update_thread_count_limit(self):
+        """线程数的上限跟随所选刊物的 max_thread_count"""
+        if not self._advanced_built:
+            return
+        venue_publisher = _VENUE_PUBLISHERS.get(self.venue_input.currentText().strip())
+        if venue_publisher is not None:
+            self.thread_count_input.setMaximum(venue_publisher.max_thread_count)
+
+    def _inputs_acceptable(self) -> bool:
+        inputs = [self.sleep_time_input]
+        kind = _VENUE_KINDS.get(self.venue_input.currentText().strip())
+        if kind is not None:
+            inputs.append(self._year_volume_inputs[kind[1]])
+        return all(not w.text() or w.hasAcceptableInput() for w in inputs)
+
+    @pyqtSlot()
+    def on_input_changed(self):
+        # 任务运行期间，按钮状态由下载流程负责管理
+        if self.workers or self.list_fetch_thread is not None:
+            return
+        self.run_button.setEnabled(self._inputs_acceptable())
+
     def run_downloader(self):
+        # 上一次任务（获取列表或下载）尚未结束时拒绝再次运行
+        if self.workers or self.list_fetch_thread is not None:
+            self.show_input_error(self._T['task_running'])
+            return
+
         logging.info('Input Checking...')
 
         venue_name = self.venue_input.currentText().strip()
@@ -506,61 +905,52 @@ class PaperDownloaderGUI(QMainWindow):
         keyword = self.keyword_input.text().strip()
         year = self.year_input.text().strip()
         volume = self.volume_input.text().strip()
-        http_proxy = self.http_proxy_input.text().strip()
-        https_proxy = self.https_proxy_input.text().strip()
 
         if not venue_name:
-            QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['venue_required'])
+            self.show_input_error(self._T['venue_required'])
             return
 
         if not save_dir:
-            QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['save_dir_required'])
+            self.show_input_error(self._T['save_dir_required'])
             return
 
         # 解析venue
-        venue_name_lower = venue.get_lower_name(venue_name)
-        venue_publisher = venue.parse_venue(venue_name_lower)
+        venue_name_lower = _VENUE_LOWER.get(venue_name)
+        venue_publisher = _VENUE_PUBLISHERS.get(venue_name)
         if not venue_publisher:
-            QMessageBox.warning(self, 'Input Error',
-                                f'{self.languages[self.current_language]["venue_unsupported"]}{venue_name_lower}')
+            self.show_input_error(f'{self._T["venue_unsupported"]}{venue_name}')
             return
 
-        # 判定是会议还是期刊，并检查 year/volume
-        if venue.is_conference(venue_publisher):
-            if not year:
-                QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['year_required'])
-                return
-            try:
-                year = int(year)
-            except ValueError:
-                QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['year_integer'])
-                return
+        # 判定是会议还是期刊，另一项被忽略
+        kind, required, ignored = _VENUE_KINDS[venue_name]
+        texts = {'year': year, 'volume': volume}
+        if not texts[required]:
+            self.show_input_error(self._T[f'{required}_required'])
+            return
+        if not self._year_volume_inputs[required].hasAcceptableInput():
+            self.show_input_error(self._T[f'{required}_integer'])
+            return
+        if texts[ignored]:
+            logging.warning(
+                f'Warning: The {kind} "{venue_name}" does not require the {ignored} field, '
+                f'but it is currently set to "{texts[ignored]}".'
+            )
+        year = int(year) if required == 'year' else None
+        volume = int(volume) if required == 'volume' else None
 
-            if volume:
-                logging.warning(
-                    f'Warning: The conference "{venue_name}" does not require the volume field, but it is currently set to "{volume}".'
-                )
-        else:
-            if not volume:
-                QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['volume_required'])
-                return
+        if sleep_time_per_paper and not self.sleep_time_input.hasAcceptableInput():
+            self.show_input_error(self._T['sleep_time_number'])
+            return
+        sleep_time_per_paper = float(sleep_time_per_paper) if sleep_time_per_paper else DEFAULT_SLEEP_TIME
+
+        # 关键词在提交时编译一次，语法错误直接提示，不必等到下载线程里才失败
+        if keyword:
             try:
-                volume = int(volume)
-            except ValueError:
-                QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['volume_integer'])
+                keyword = re.compile(keyword, re.IGNORECASE)
+            except re.error as e:
+                self.show_input_error(f'{self._T["keyword_regex"]}{e}')
                 return
 
-            if year:
-                logging.warning(
-                    f'Warning: The journal "{venue_name}" does not require the year field, but it is currently set to "{year}".'
-                )
-
-        try:
-            sleep_time_per_paper = float(sleep_time_per_paper) if sleep_time_per_paper else DEFAULT_SLEEP_TIME
-        except ValueError:
-            QMessageBox.warning(self, 'Input Error', self.languages[self.current_language]['sleep_time_number'])
-            return
-
         logging.info('Check complete!')
 
         # 更新按钮状态，先全部禁用，等获取列表成功后再启用
@@ -571,14 +961,11 @@ class PaperDownloaderGUI(QMainWindow):
         logging.info('Starting to fetch paper list...')
 
         # 设置代理
-        proxies = {}
-        if http_proxy:
-            proxies['http'] = http_proxy
-        if https_proxy:
-            proxies['https'] = https_proxy
-
-        # 实例化publisher
-        self.publisher_instance = venue_publisher(
+        proxies = self._get_proxies()
+
+        # publisher 在获取列表的线程里实例化
+        publisher_factory = functools.partial(
+            venue_publisher,
             save_dir=save_dir,
             sleep_time_per_paper=sleep_time_per_paper,
             keyword=keyword,
@@ -594,14 +981,30 @@ class PaperDownloaderGUI(QMainWindow):
         self.progress_bar.show()
 
         # 启动获取列表的线程
-        self.list_fetch_thread = PaperListFetchThread(self.publisher_instance)
-        self.list_fetch_thread.paper_list_ready.connect(self.on_paper_list_ready)
-        self.list_fetch_thread.error_signal.connect(self.on_paper_list_error)
+        # 线程以窗口为 parent，释放 Python 端引用时不会销毁仍在收尾的线程；
+        # 线程真正结束后由 Qt 负责删除
+        self.list_fetch_thread = PaperListFetchThread(publisher_factory, self)
+        self.list_fetch_thread.paper_list_ready.connect(self.on_paper_list_ready, Qt.QueuedConnection)
+        self.list_fetch_thread.error_signal.connect(self.on_paper_list_error, Qt.QueuedConnection)
+        self.list_fetch_thread.finished.connect(self.list_fetch_thread.deleteLater)
         self.list_fetch_thread.start()
 
-    @pyqtSlot(list)
-    def on_paper_list_ready(self, paper_list):
-        self.list_fetch_thread = None
+    def _release_list_fetch_thread(self):
+        """断开获取列表线程的信号连接并释放引用"""
+        thread, self.list_fetch_thread = self.list_fetch_thread, None
+        if thread is None:
+            return
+        for signal, slot in ((thread.paper_list_ready, self.on_paper_list_ready),
+                             (thread.error_signal, self.on_paper_list_error)):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass
+
+    @pyqtSlot(object, list)
+    def on_paper_list_ready(self, publisher_instance, paper_list):
+        self._release_list_fetch_thread()
+        self.publisher_instance = publisher_instance
 
         self.progress_bar.setFormat("%p%")
         # 重置进度条文字
@@ -609,7 +1012,7 @@ class PaperDownloaderGUI(QMainWindow):
             logging.warning('The paper list is empty!')
             QMessageBox.information(self, "Info", "No papers to download.")
             self.reset_progress()
-            self.run_button.setEnabled(True)
+            self.run_button.setEnabled(self._inputs_acceptable())
             return
 
         logging.info(f"{len(paper_list)} papers have been fetched.")
@@ -617,23 +1020,36 @@ class PaperDownloaderGUI(QMainWindow):
         self.task_complete_count = 0
 
         # 判断并行/串行
-        parallel = (self.btn_group.checkedButton().text() == self.languages[self.current_language]['enable'])
-        self.num_threads = min(os.cpu_count(), self.publisher_instance.max_thread_count) if parallel else 1
+        parallel = self.advanced_settings.isChecked() and self.parallel_enable_button.isChecked()
+        # 下载属于 I/O 密集型任务，线程大部分时间阻塞在网络和 sleep 上（此时会释放 GIL），
+        # 因此线程数由用户指定而不受 CPU 核数限制，但不超过刊物的 max_thread_count（与 CLI 一致）
+        if parallel:
+            self.num_threads = min(self.thread_count_input.value(),
+                                   self.publisher_instance.max_thread_count,
+                                   len(paper_list))
+        else:
+            self.num_threads = 1
+        if self.thread_pool.maxThreadCount() < self.num_threads:
+            self.thread_pool.setMaxThreadCount(self.num_threads)
         logging.info(f"The total number of threads is {self.num_threads}.")
 
         # 进行任务切分并创建 DownloaderThread
         task_per_thread = (len(paper_list) + self.num_threads - 1) // self.num_threads
         for i in range(self.num_threads):
-            sub_list = paper_list[i * task_per_thread: (i + 1) * task_per_thread]
-            thread = DownloaderThread(
+            start = i * task_per_thread
+            end = min(len(paper_list), start + task_per_thread)
+            worker = DownloaderRunnable(
                 publisher=self.publisher_instance,
-                paper_entry_list=sub_list
+                paper_entry_list=paper_list,
+                start=start,
+                end=end
             )
-            thread.finished_signal.connect(self.finish_downloader)
-            thread.progress_signal.connect(self.update_progress)
-            thread.paused_signal.connect(self.on_thread_paused)
-            thread.resumed_signal.connect(self.on_thread_resumed)
-            self.threads.append(thread)
+            # 跨线程信号，显式使用 QueuedConnection
+            worker.signals.finished_signal.connect(self.finish_downloader, Qt.QueuedConnection)
+            worker.signals.progress_signal.connect(self.on_thread_progress, Qt.QueuedConnection)
+            worker.signals.paused_signal.connect(self.on_thread_paused, Qt.QueuedConnection)
+            worker.signals.resumed_signal.connect(self.on_thread_resumed, Qt.QueuedConnection)
+            self.workers.append(worker)
 
         # 更新按钮状态
         self.stop_button.setEnabled(True)
@@ -642,39 +1058,39 @@ class PaperDownloaderGUI(QMainWindow):
 
         # 启动下载线程
         self.start_progress()
-        for thread in self.threads:
-            thread.start()
+        for worker in self.workers:
+            self.thread_pool.start(worker)
 
     @pyqtSlot(str)
     def on_paper_list_error(self, err_msg):
         """
         当 PaperListFetchThread 出错时，触发此槽函数
         """
-        self.list_fetch_thread = None
+        self._release_list_fetch_thread()
         logging.error(f"Failed to fetch paper list: {err_msg}")
         QMessageBox.critical(self, "Error", f"Error while fetching paper list:\n{err_msg}")
 
         self.reset_progress()
         # 恢复“Run”按钮可用
-        self.run_button.setEnabled(True)
+        self.run_button.setEnabled(self._inputs_acceptable())
 
     def stop_downloader(self):
         """点击「Stop」按钮后，仅发送停止请求，不阻塞主线程"""
-        if self.threads:
+        if self.workers:
             confirm = QMessageBox.question(
                 self,
-                self.languages[self.current_language]['stop_confirm_title'],
-                self.languages[self.current_language]['stop_confirm_text'],
+                self._T['stop_confirm_title'],
+                self._T['stop_confirm_text'],
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
             if confirm == QMessageBox.Yes:
                 logging.info('Stopping all downloader threads...')
-                for thread in self.threads:
-                    thread.stop()
+                for worker in self.workers:
+                    worker.stop()
                 logging.info('Stop signal sent to all downloader threads.')
         else:
-            QMessageBox.information(self, 'Info', self.languages[self.current_language]['no_active_to_stop'])
+            QMessageBox.information(self, 'Info', self._T['no_active_to_stop'])
 
     def pause_downloader(self):
         logging.info('Pausing all downloader threads...')
@@ -682,8 +1098,8 @@ class PaperDownloaderGUI(QMainWindow):
         self.paused_count = 0
         self.resumed_count = 0
 
-        for thread in self.threads:
-            thread.pause()
+        for worker in self.workers:
+            worker.pause()
 
         self.run_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -694,8 +1110,8 @@ class PaperDownloaderGUI(QMainWindow):
         logging.info('Resuming all downloader threads...')
         self.resumed_count = 0
 
-        for thread in self.threads:
-            thread.resume()
+        for worker in self.workers:
+            worker.resume()
 
         self.run_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -705,58 +1121,66 @@ class PaperDownloaderGUI(QMainWindow):
     @pyqtSlot()
     def on_thread_paused(self):
         """某个线程进入 paused 状态时的回调"""
-        self.mutex.lock()
         self.paused_count += 1
         if self.paused_count == self.num_threads:
             logging.info("All threads have been paused.")
-        self.mutex.unlock()
 
     @pyqtSlot()
     def on_thread_resumed(self):
         """某个线程恢复时的回调"""
-        self.mutex.lock()
         self.resumed_count += 1
         if self.resumed_count == self.num_threads:
             logging.info("All threads have been resumed.")
-        self.mutex.unlock()
 
     @pyqtSlot()
     def finish_downloader(self):
         """某个线程结束时的回调"""
-        self.mutex.lock()
         self.finished_threads += 1
         if self.finished_threads == self.num_threads:
             # 所有线程都结束
-            self.run_button.setEnabled(True)
+            self.run_button.setEnabled(self._inputs_acceptable())
             self.stop_button.setEnabled(False)
             self.pause_button.setEnabled(False)
             self.resume_button.setEnabled(False)
             logging.info('All downloader threads have been stopped or finished normally.')
             logging.info('Download Finished!')
-            QMessageBox.information(self, "Finish", self.languages[self.current_language]['task_completed'])
+            QMessageBox.information(self, "Finish", self._T['task_completed'])
             self.reset_progress()
-        self.mutex.unlock()
 
     @pyqtSlot(str)
     def append_log(self, log):
-        self.log_output.append(log)
-        self.log_output.ensureCursorVisible()
+        self._log_history.extend(log.split('\n'))
+        # 先缓存起来，由定时器合并后一次性插入，限制日志窗口的重绘频率
+        self._log_pending.append(log)
+        if not self._log_append_timer.isActive():
+            self._log_append_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending_logs(self):
+        if not self._log_pending:
+            return
+        self._ensure_log()
+        # appendPlainText 只在滚动条位于底部时才会自动滚动
+        self.log_output.appendPlainText('\n'.join(self._log_pending))
+        self._log_pending.clear()
 
     @pyqtSlot()
     def export_log(self):
-        log = self.log_output.toPlainText()
-        if not log:
-            QMessageBox.information(self, 'Info', self.languages[self.current_language]['no_log_to_export'])
+        if not self._log_history:
+            QMessageBox.information(self, 'Info', self._T['no_log_to_export'])
+            return
+
+        filename, _ = QFileDialog.getSaveFileName(self, self._T['select_save_file'])
+        if not filename:
             return
 
-        filename, _ = QFileDialog.getSaveFileName(self, self.languages[self.current_language]['select_save_file'])
-        if filename:
-            with open(filename, 'a', encoding='utf-8') as file:
-                file.write(log)
-                file.write('\n')
+        with open(filename, 'wb', buffering=1 << 20) as file:
+            file.writelines(f'{line}\n'.encode('utf-8') for line in self._log_history)
 
     @pyqtSlot()
     def clear_log(self):
+        self._log_history.clear()
+        self._log_pending.clear()
         self.log_output.clear()
 
 
@@ -765,4 +1189,6 @@ if __name__ == '__main__':
     gui = PaperDownloaderGUI()
     gui.resize(600, 600)
     gui.show()
+    # 窗口显示后在后台预先导入下载依赖，避免首次点击 Run 时卡顿
+    threading.Thread(target=downloader.warm_up, daemon=True).start()
     sys.exit(app.exec_())
@@ -1,9 +1,14 @@
 import argparse
+import http.server
 import logging
 import os
 import random
+import re
 import shutil
 import sys
+import tempfile
+import threading
+import time
 import unittest
 
 current_dir = os.path.dirname(os.path.realpath(__file__))
@@ -17,7 +22,7 @@ full_test = False
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
-from core import venue
+from core import downloader, venue
 
 
 class Test(unittest.TestCase):
@@ -162,6 +167,144 @@ class Test(unittest.TestCase):
                       is_conf=False)
 
 
+## 以下用例不访问外网，可离线运行
+class VenueTest(unittest.TestCase):
+    def test_parse_venue_ignores_whitespace_and_case(self):
+        cvpr = venue.parse_venue('cvpr')
+        self.assertIsNotNone(cvpr)
+        self.assertIs(venue.parse_venue(' CVPR '), cvpr)
+        # 从网页复制的名称中可能带有不间断空格
+        self.assertIs(venue.parse_venue('\xa0CVPR\xa0'), cvpr)
+        self.assertIs(venue.parse_venue('Cv\xa0Pr'), cvpr)
+
+    def test_parse_venue_unknown(self):
+        self.assertIsNone(venue.parse_venue('unknown-venue'))
+        self.assertIsNone(venue.parse_venue(''))
+
+    def test_keyword_str_is_compiled_case_insensitively(self):
+        with tempfile.TemporaryDirectory() as save_dir:
+            publisher = venue.parse_venue('cvpr')(save_dir=save_dir, venue_name='cvpr', year=2024, keyword='graph')
+        self.assertIsInstance(publisher.keyword, re.Pattern)
+        self.assertTrue(publisher.keyword.flags & re.IGNORECASE)
+        self.assertIsNotNone(publisher.keyword.search('A GRAPH Network'))
+
+    def test_keyword_pattern_is_kept(self):
+        pattern = re.compile('graph')
+        with tempfile.TemporaryDirectory() as save_dir:
+            publisher = venue.parse_venue('cvpr')(save_dir=save_dir, venue_name='cvpr', year=2024, keyword=pattern)
+        self.assertIs(publisher.keyword, pattern)
+
+
+class _FileHandler(http.server.BaseHTTPRequestHandler):
+    body = os.urandom(300 * 1024)
+
+    def do_GET(self):
+        if self.path == '/full':
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body)
+        elif self.path == '/truncated':
+            # 声明完整长度，但只发送一部分后关闭连接
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body[:len(self.body) // 3])
+            self.close_connection = True
+        elif self.path == '/busy':
+            self.send_response(503)
+            self.send_header('Retry-After', '3600')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DownloaderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _FileHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server_thread.join()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, 'paper.pdf')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_download_file_full_body(self):
+        downloader.download_file(f'{self.base_url}/full', self.filename)
+        with open(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), _FileHandler.body)
+        self.assertFalse(os.path.exists(self.filename + '.part'))
+
+    def test_download_file_truncated_body(self):
+        with self.assertLogs(level='ERROR'):
+            downloader.download_file(f'{self.base_url}/truncated', self.filename)
+        self.assertFalse(os.path.exists(self.filename))
+        self.assertFalse(os.path.exists(self.filename + '.part'))
+
+    def test_download_file_ignores_retry_after(self):
+        # 重试等待不能由服务端的 Retry-After 决定，否则停止下载时线程会长时间卡住
+        start = time.monotonic()
+        with self.assertLogs(level='ERROR'):
+            downloader.download_file(f'{self.base_url}/busy', self.filename)
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_download_file_http_error(self):
+        with self.assertLogs(level='ERROR'):
+            downloader.download_file(f'{self.base_url}/missing', self.filename)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+class GuiInputTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        try:
+            from PyQt5.QtWidgets import QApplication
+        except ImportError:
+            raise unittest.SkipTest('PyQt5 is not installed')
+        cls.app = QApplication.instance() or QApplication([])
+        # gui 在导入时按当前目录定位 config 目录
+        cwd = os.getcwd()
+        os.chdir(parent_dir)
+        try:
+            import gui
+            cls.gui = gui.PaperDownloaderGUI()
+        finally:
+            os.chdir(cwd)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.gui.close()
+        cls.gui.deleteLater()
+
+    def test_int_inputs_reject_group_separators(self):
+        # 带千位分隔符的文本若通过校验，run_downloader 中的 int() 会抛出异常
+        for line_edit in (self.gui.year_input, self.gui.volume_input):
+            for text in ('2,024', '1,000', '2.024', '1.000'):
+                line_edit.setText(text)
+                self.assertFalse(line_edit.hasAcceptableInput(), text)
+        self.gui.year_input.setText('2024')
+        self.gui.volume_input.setText('1000')
+        self.assertTrue(self.gui.year_input.hasAcceptableInput())
+        self.assertTrue(self.gui.volume_input.hasAcceptableInput())
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run Test.')
     parser.add_argument('-f', '--full-test',